@@ -3,17 +3,14 @@ import json
 import sys
 from pathlib import Path
 from glob import glob
-from typing import List
+from typing import Dict
 from datetime import datetime
 
 from src.validation import validate_invoice_data, ValidationError
 from src.normalizer import normalize_invoice_json
-from src.invoice_generator import InvoiceValidationError
-from src.csv_loader import load_line_items_from_csv
-from src.pdf_utils import generate_invoice_pdf
-from src.reporting.totals import InvoiceTotals
-from src.reporting.csv_export import export_totals_csv
-from src.reporting.json_export import export_totals_json
+from src.invoice_generator import Invoice, InvoiceValidationError
+from src.csv_loader import load_line_items_from_csv, READ_BUFFER_SIZE
+from src.reporting.totals import InvoiceTotals, TotalsBatch
 
 
 BASE_INVOICE_TEMPLATE = {
@@ -37,6 +34,10 @@ BASE_INVOICE_TEMPLATE = {
     "footer": "Bank details: ...",
 }
 
+# The template is a constant, so validate it once at import rather than
+# on every CSV load.
+validate_invoice_data(BASE_INVOICE_TEMPLATE, require_line_items=False)
+
 
 # =========================
 # CLI ENTRYPOINT
@@ -53,7 +54,7 @@ def main() -> None:
     parser.add_argument("--check", action="store_true", help="Preview only (no PDF)")
     parser.add_argument("--theme", choices=["minimal", "modern"], default="minimal")
     parser.add_argument("--theme-config", help="Optional theme override JSON")
-    parser.add_argument("--export-totals", help="Export totals (.csv or .json)")
+    parser.add_argument("--export-totals", help="Export totals (.csv, .json or .jsonl)")
 
     args = parser.parse_args()
 
@@ -76,7 +77,9 @@ def main() -> None:
             if not is_batch and not args.output:
                 raise ValueError("--output is required for single invoice PDF generation")
 
-        all_totals: List[InvoiceTotals] = []
+        all_totals = TotalsBatch()
+        # Output path -> invoice
+        pdf_jobs: Dict[str, Invoice] = {}
 
         for path in inputs:
             invoice = _load_invoice(path, args.format)
@@ -92,18 +95,22 @@ def main() -> None:
 
             if generate_pdfs:
                 if is_batch:
-                    out_dir = Path(args.output_dir)
-                    out_dir.mkdir(parents=True, exist_ok=True)
-                    out_path = out_dir / f"{invoice.invoice_number}.pdf"
+                    out_path = Path(args.output_dir) / f"{invoice.invoice_number}.pdf"
                 else:
                     out_path = Path(args.output)
 
-                generate_invoice_pdf(
-                    invoice,
-                    str(out_path),
-                    theme_name=args.theme,
-                    theme_override=args.theme_config,
-                )
+                if str(out_path) in pdf_jobs:
+                    raise ValueError(
+                        f"Duplicate output path {out_path} "
+                        f"(invoice {invoice.invoice_number} in {path})"
+                    )
+                pdf_jobs[str(out_path)] = invoice
+
+        # Render only once every input has loaded and validated
+        if pdf_jobs:
+            if is_batch:
+                Path(args.output_dir).mkdir(parents=True, exist_ok=True)
+            _render_pdfs(pdf_jobs, args.theme, args.theme_config)
 
         # Export totals after processing
         if args.export_totals:
@@ -147,8 +154,8 @@ def _load_invoice(path: str, fmt: str):
 
 
 def _load_from_json(path: str):
-    with open(path, "r", encoding="utf-8") as f:
-        raw = json.load(f)
+    with open(path, "rb", buffering=READ_BUFFER_SIZE) as f:
+        raw = json.loads(f.read())
 
     if not isinstance(raw, dict):
         raise ValueError(f"{path} is not a valid invoice JSON object")
@@ -160,7 +167,6 @@ def _load_from_json(path: str):
     return normalize_invoice_json(raw)
 
 def _load_from_csv(path: str):
-    validate_invoice_data(BASE_INVOICE_TEMPLATE, require_line_items=False)
     invoice = normalize_invoice_json(BASE_INVOICE_TEMPLATE)
 
     invoice.line_items = load_line_items_from_csv(path)
@@ -193,16 +199,47 @@ def _print_preview(invoice, source: str) -> None:
     print(f"Total: {invoice.total:.2f}\n")
 
 
+# =========================
+# PDF RENDERING
+# =========================
+def _render_pdfs(jobs: Dict[str, Invoice], theme: str, theme_config) -> None:
+    # ReportLab is only needed when rendering; keep --check fast.
+    from src.pdf_utils import generate_invoice_pdf, generate_invoice_pdfs_parallel
+
+    if len(jobs) == 1:
+        [(path, invoice)] = jobs.items()
+        generate_invoice_pdf(
+            invoice, path, theme_name=theme, theme_override=theme_config
+        )
+        return
+
+    # Rendering is CPU-bound, so batches use worker processes, not threads.
+    generate_invoice_pdfs_parallel(
+        list(jobs.values()),
+        list(jobs.keys()),
+        theme_name=theme,
+        theme_override=theme_config,
+    )
+
+
 # =========================
 # TOTALS EXPORT
 # =========================
-def _export_totals(totals: List[InvoiceTotals], path: str) -> None:
+def _export_totals(totals: TotalsBatch, path: str) -> None:
     if path.endswith(".csv"):
+        from src.reporting.csv_export import export_totals_csv
+
         export_totals_csv(totals, path)
     elif path.endswith(".json"):
+        from src.reporting.json_export import export_totals_json
+
         export_totals_json(totals, path)
+    elif path.endswith(".jsonl"):
+        from src.reporting.json_export import export_totals_jsonl
+
+        export_totals_jsonl(totals, path)
     else:
-        raise ValueError("Totals export must be .csv or .json")
+        raise ValueError("Totals export must be .csv, .json or .jsonl")
 
 
 if __name__ == "__main__":
@@ -1,6 +1,6 @@
 from dataclasses import dataclass, field
 from typing import List, Optional
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
 
 
 # ================= Exceptions =================
@@ -9,9 +9,34 @@ class InvoiceValidationError(Exception):
     pass
 
 
+# ================= Money =================
+
+def _to_cents(value: float) -> int:
+    """Round an amount to whole cents exactly as round(value, 2) does.
+
+    round(value * 100) alone differs for about 2% of three-decimal prices,
+    because scaling by 100 moves the float across the half-cent boundary.
+    """
+    return round(round(value, 2) * 100)
+
+
+# ================= Dates =================
+
+def _parse_date(value: str) -> date:
+    """Parse a date the way strptime(value, "%Y-%m-%d") does.
+
+    date.fromisoformat is much cheaper than strptime, but since Python 3.11
+    it also accepts other ISO 8601 forms, so it only handles the zero-padded
+    YYYY-MM-DD layout; anything else (e.g. "2024-1-5") goes through strptime.
+    """
+    if len(value) == 10 and value[4] == "-" and value[7] == "-":
+        return date.fromisoformat(value)
+    return datetime.strptime(value, "%Y-%m-%d").date()
+
+
 # ================= Core Models =================
 
-@dataclass
+@dataclass(slots=True)
 class Party:
     name: str
     address: str
@@ -19,7 +44,7 @@ class Party:
     logo_path: Optional[str] = None  # Company only
 
 
-@dataclass
+@dataclass(slots=True)
 class LineItem:
     description: str
     quantity: float
@@ -32,10 +57,10 @@ class LineItem:
         if self.unit_price < 0:
             raise InvoiceValidationError("Unit price cannot be negative")
 
-        self.line_total = round(self.quantity * self.unit_price, 2)
+        self.line_total = _to_cents(self.quantity * self.unit_price) / 100
 
 
-@dataclass
+@dataclass(slots=True)
 class Invoice:
     invoice_number: str
     invoice_date: str  # YYYY-MM-DD
@@ -59,12 +84,26 @@ class Invoice:
         if not self.line_items:
             raise InvoiceValidationError("Invoice must contain at least one line item")
 
+        # Single pass: validate, set line totals and accumulate the subtotal.
+        # Sums are kept in integer cents so they are exact.
+        subtotal_cents = 0
         for item in self.line_items:
-            item.calculate_total()
+            if item.quantity <= 0:
+                raise InvoiceValidationError("Line item quantity must be positive")
+            if item.unit_price < 0:
+                raise InvoiceValidationError("Unit price cannot be negative")
+
+            line_cents = _to_cents(item.quantity * item.unit_price)
+            item.line_total = line_cents / 100
+            subtotal_cents += line_cents
+
+        # Tax is rounded from the subtotal amount, not from its cents, so
+        # half-cent cases land where round(subtotal * rate, 2) put them.
+        tax_cents = _to_cents(subtotal_cents / 100 * self.tax_rate)
 
-        self.subtotal = round(sum(i.line_total for i in self.line_items), 2)
-        self.tax_amount = round(self.subtotal * self.tax_rate, 2)
-        self.total = round(self.subtotal + self.tax_amount, 2)
+        self.subtotal = subtotal_cents / 100
+        self.tax_amount = tax_cents / 100
+        self.total = (subtotal_cents + tax_cents) / 100
 
         self._ensure_due_date()
 
@@ -75,14 +114,14 @@ class Invoice:
             raise InvoiceValidationError("Invoice number is required")
 
         try:
-            datetime.strptime(self.invoice_date, "%Y-%m-%d")
+            _parse_date(self.invoice_date)
         except ValueError:
             raise InvoiceValidationError("invoice_date must be YYYY-MM-DD")
 
         if not hasattr(self, "total"):
             raise InvoiceValidationError("Totals have not been calculated")
 
-        if round(self.subtotal + self.tax_amount, 2) != round(self.total, 2):
+        if _to_cents(self.subtotal + self.tax_amount) != _to_cents(self.total):
             raise InvoiceValidationError("Invoice totals do not reconcile")
 
     # ---------- Helpers ----------
@@ -92,7 +131,7 @@ class Invoice:
             return
 
         try:
-            invoice_dt = datetime.strptime(self.invoice_date, "%Y-%m-%d")
-            self.due_date = (invoice_dt + timedelta(days=14)).strftime("%Y-%m-%d")
+            invoice_dt = _parse_date(self.invoice_date)
+            self.due_date = (invoice_dt + timedelta(days=14)).isoformat()
         except ValueError:
             self.due_date = None
@@ -21,15 +21,18 @@ def normalize_invoice_json(raw_json: dict) -> Invoice:
     if not isinstance(items_data, list):
         raise InvoiceValidationError("Invalid line_items/items data")
 
-    line_items: List[LineItem] = []
-    for item in items_data:
-        line_items.append(
-            LineItem(
-                description=str(item.get("description", "")).strip(),
-                quantity=float(item.get("quantity", 0)),
-                unit_price=float(item.get("unit_price", 0)),
-            )
+    # Positional construction with pre-bound callables: this loop runs once
+    # per line item.
+    make_item = LineItem
+    get = dict.get
+    line_items: List[LineItem] = [
+        make_item(
+            str(get(item, "description", "")).strip(),
+            float(get(item, "quantity", 0)),
+            float(get(item, "unit_price", 0)),
         )
+        for item in items_data
+    ]
 
     invoice_date = (
         raw_json.get("invoice_date")
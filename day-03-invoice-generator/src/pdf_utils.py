@@ -2,6 +2,12 @@
 from __future__ import annotations
 
 import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import repeat
+from typing import Sequence
+
 from reportlab.lib.pagesizes import A4
 from reportlab.pdfgen import canvas
 from reportlab.lib.units import mm
@@ -9,6 +15,7 @@ from reportlab.lib.utils import ImageReader
 from reportlab.platypus import Paragraph
 from reportlab.lib.styles import ParagraphStyle
 from reportlab.lib.enums import TA_LEFT
+from reportlab.pdfbase.pdfmetrics import stringWidth
 
 from src.invoice_generator import Invoice
 from src.themes import load_theme
@@ -37,33 +44,141 @@ META_LINE_GAP = 12
 MAX_LOGO_WIDTH = 45 * mm
 MAX_LOGO_HEIGHT = 22 * mm
 
+# Text Paragraph would treat differently from drawString: markup, entities,
+# explicit line breaks and collapsible whitespace runs.
+_NEEDS_PARAGRAPH = re.compile(r"[<>&\t\r\n]|\s\s")
+
 
 def generate_invoice_pdf(
     invoice: Invoice,
     output_path: str,
     theme_name: str = "minimal",
     theme_override: str | None = None,
+    compress: bool = True,
 ) -> None:
     theme = load_theme(theme_name, theme_override)
 
-    c = canvas.Canvas(output_path, pagesize=A4)
-    y = PAGE_HEIGHT - TOP_MARGIN
+    c = _new_canvas(output_path, compress)
+    _emit_invoice(c, invoice, theme, _description_style(theme))
+    c.save()
+
+
+def generate_invoice_pdfs(
+    invoices: Sequence[Invoice],
+    output_path: str,
+    theme_name: str = "minimal",
+    theme_override: str | None = None,
+    compress: bool = True,
+) -> None:
+    """Render several invoices into one multi-page PDF with a single save."""
+    theme = load_theme(theme_name, theme_override)
+    desc_style = _description_style(theme)
+
+    c = _new_canvas(output_path, compress)
+    for invoice in invoices:
+        _emit_invoice(c, invoice, theme, desc_style)
+    c.save()
+
+
+def generate_invoice_pdfs_parallel(
+    invoices: Sequence[Invoice],
+    output_paths: Sequence[str],
+    theme_name: str = "minimal",
+    theme_override: str | None = None,
+    max_workers: int | None = None,
+    compress: bool = True,
+) -> None:
+    """Render one PDF per invoice across worker processes."""
+    if len(invoices) != len(output_paths):
+        raise ValueError("Each invoice needs exactly one output path")
+
+    workers = min(max_workers or os.cpu_count() or 1, len(invoices)) or 1
+    # A few chunks per worker keeps pickling overhead low without starving
+    # workers at the tail of the batch.
+    chunksize = max(1, len(invoices) // (4 * workers))
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Consume the iterator so worker exceptions are re-raised here.
+        list(
+            executor.map(
+                generate_invoice_pdf,
+                invoices,
+                output_paths,
+                repeat(theme_name),
+                repeat(theme_override),
+                repeat(compress),
+                chunksize=chunksize,
+            )
+        )
+
+
+def _new_canvas(output_path: str, compress: bool) -> _CanvasState:
+    # Uncompressed pages render noticeably faster; useful for throwaway output.
+    return _CanvasState(
+        canvas.Canvas(output_path, pagesize=A4, pageCompression=int(compress))
+    )
+
+
+class _CanvasState:
+    """Canvas proxy that drops setFont/setFillColor calls which change nothing.
+
+    The wrapped canvas already tracks its current font and fill colour and
+    resets them on showPage/restoreState, so no state is duplicated here.
+    """
+
+    def __init__(self, c: canvas.Canvas) -> None:
+        self._canvas = c
 
-    desc_style = ParagraphStyle(
+    def __getattr__(self, name: str):
+        value = getattr(self._canvas, name)
+        if callable(value):
+            # Bound methods are stable; cache them to skip this hook next time.
+            setattr(self, name, value)
+        return value
+
+    def setFont(self, psfontname: str, size: float, leading: float | None = None) -> None:
+        c = self._canvas
+        if leading is None:
+            leading = size * 1.2
+        if (c._fontname, c._fontsize, c._leading) != (psfontname, size, leading):
+            c.setFont(psfontname, size, leading)
+
+    def setFillColor(self, color, alpha=None) -> None:
+        if alpha is not None or self._canvas._fillColorObj is not color:
+            self._canvas.setFillColor(color, alpha)
+
+
+def _description_style(theme) -> ParagraphStyle:
+    return _paragraph_style(
+        theme["font"], theme["base_font_size"], theme["line_height"] + 2
+    )
+
+
+@lru_cache(maxsize=16)
+def _paragraph_style(font: str, font_size: float, leading: float) -> ParagraphStyle:
+    # Styles are only read while drawing, so one instance per combination
+    # can be shared by every invoice in the process.
+    return ParagraphStyle(
         name="Description",
-        fontName=theme["font"],
-        fontSize=theme["base_font_size"],
-        leading=theme["line_height"] + 2,
+        fontName=font,
+        fontSize=font_size,
+        leading=leading,
         alignment=TA_LEFT,
     )
 
+
+def _emit_invoice(c, invoice: Invoice, theme, desc_style) -> None:
+    """Draw one invoice starting on a fresh page; the caller saves."""
+    y = PAGE_HEIGHT - TOP_MARGIN
+
     y = _draw_header(c, invoice, y, theme)
     y -= 18
 
     y = _draw_parties(c, invoice, y, theme)
     y -= 24
 
-    y = _draw_line_items(c, invoice, y, theme, desc_style)
+    cells = _format_line_item_cells(invoice, theme)
+    y = _draw_line_items(c, invoice, y, theme, desc_style, cells)
 
     totals_y = max(y - 24, TOTALS_MIN_Y)
     _draw_totals(c, invoice, totals_y, theme)
@@ -74,7 +189,6 @@ def generate_invoice_pdf(
     _draw_footer(c, invoice, theme)
 
     c.showPage()
-    c.save()
 
 
 # ---------------- Header ----------------
@@ -84,26 +198,22 @@ def _draw_header(c, invoice: Invoice, y: float, theme) -> float:
 
     logo_width = 0
 
-    if invoice.company.logo_path:
-        path = invoice.company.logo_path
-        if not os.path.isabs(path):
-            path = os.path.join(os.getcwd(), path)
-
-        if os.path.exists(path):
-            img = ImageReader(path)
-            iw, ih = img.getSize()
-            scale = min(MAX_LOGO_HEIGHT / ih, MAX_LOGO_WIDTH / iw)
-            logo_width = iw * scale
-            logo_height = ih * scale
-
-            c.drawImage(
-                img,
-                LEFT_MARGIN,
-                content_y - logo_height + 4,
-                width=logo_width,
-                height=logo_height,
-                mask="auto",
-            )
+    logo = _find_logo(invoice.company.logo_path)
+
+    if logo:
+        img, iw, ih = logo
+        scale = min(MAX_LOGO_HEIGHT / ih, MAX_LOGO_WIDTH / iw)
+        logo_width = iw * scale
+        logo_height = ih * scale
+
+        c.drawImage(
+            img,
+            LEFT_MARGIN,
+            content_y - logo_height + 4,
+            width=logo_width,
+            height=logo_height,
+            mask="auto",
+        )
 
     text_x = LEFT_MARGIN + logo_width + (10 if logo_width else 0)
 
@@ -136,6 +246,31 @@ def _draw_header(c, invoice: Invoice, y: float, theme) -> float:
     return header_bottom
 
 
+def _find_logo(logo_path: str | None):
+    if not logo_path:
+        return None
+
+    if not os.path.isabs(logo_path):
+        logo_path = os.path.join(os.getcwd(), logo_path)
+
+    # Missing logos are skipped rather than failing the invoice. The check
+    # stays outside the cache so a logo created later is still picked up.
+    if not os.path.exists(logo_path):
+        return None
+    return _load_logo(logo_path)
+
+
+@lru_cache(maxsize=64)
+def _load_logo(abs_path: str) -> tuple[ImageReader, int, int]:
+    """Open and decode a logo once per path; batches share one company logo.
+
+    Unreadable or undecodable files raise.
+    """
+    img = ImageReader(abs_path)
+    iw, ih = img.getSize()
+    return img, iw, ih
+
+
 # ---------------- Parties ----------------
 def _draw_parties(c, invoice: Invoice, y: float, theme) -> float:
     left_x = LEFT_MARGIN
@@ -154,30 +289,42 @@ def _draw_parties(c, invoice: Invoice, y: float, theme) -> float:
 
 def _draw_party_block(c, party, x: float, y: float, theme) -> float:
     c.setFont(theme["font"], theme["base_font_size"])
-    offset = 0
-
-    c.drawString(x, y, party.name)
-    offset += theme["line_height"]
-
-    for line in party.address.split("\n"):
-        c.drawString(x, y - offset, line)
-        offset += theme["line_height"]
+    line_height = theme["line_height"]
 
+    lines = [party.name, *party.address.splitlines()]
     if party.email:
-        c.drawString(x, y - offset, party.email)
-        offset += theme["line_height"]
+        lines.append(party.email)
 
-    return offset
+    for i, line in enumerate(lines):
+        c.drawString(x, y - i * line_height, line)
+
+    return len(lines) * line_height
 
 
 # ---------------- Line Items ----------------
-def _draw_line_items(c, invoice: Invoice, y: float, theme, desc_style) -> float:
+def _format_line_item_cells(invoice: Invoice, theme) -> list[tuple[str, str, str]]:
+    """Pre-format the (qty, unit price, amount) strings for every row."""
+    sym = theme["currency_symbol"]
+    return [
+        (
+            str(item.quantity),
+            # Unit prices are raw input, not rounded to cents.
+            f"{sym}{item.unit_price:,.2f}",
+            _format_money(item.line_total, sym),
+        )
+        for item in invoice.line_items
+    ]
+
+
+def _draw_line_items(c, invoice: Invoice, y: float, theme, desc_style, cells) -> float:
     def draw_header(y_pos):
-        c.setFont(theme["font_bold"], theme["base_font_size"])
+        font_bold = theme["font_bold"]
+        size = theme["base_font_size"]
+        c.setFont(font_bold, size)
         c.drawString(COL_DESC, y_pos, "Description")
-        c.drawRightString(COL_QTY, y_pos, "Qty")
-        c.drawRightString(COL_UNIT, y_pos, "Unit Price")
-        c.drawRightString(COL_TOTAL, y_pos, "Amount")
+        _draw_label_right(c, COL_QTY, y_pos, "Qty", font_bold, size)
+        _draw_label_right(c, COL_UNIT, y_pos, "Unit Price", font_bold, size)
+        _draw_label_right(c, COL_TOTAL, y_pos, "Amount", font_bold, size)
 
         c.setStrokeColor(theme["accent"])
         c.line(
@@ -189,14 +336,33 @@ def _draw_line_items(c, invoice: Invoice, y: float, theme, desc_style) -> float:
 
         return y_pos - theme["line_height"] - theme["rule_gap"]
 
-    y = draw_header(y)
+    font = theme["font"]
+    font_size = theme["base_font_size"]
+    line_height = theme["line_height"]
+    row_padding = theme["row_padding"]
+    avail_width = COL_QTY - COL_DESC - 8
+    draw_right = c.drawRightString
+    desc_fill = desc_style.textColor
 
-    for item in invoice.line_items:
-        desc = Paragraph(item.description, desc_style)
-        avail_width = COL_QTY - COL_DESC - 8
-        _, desc_h = desc.wrap(avail_width, PAGE_HEIGHT)
-
-        row_height = max(desc_h, theme["line_height"]) + theme["row_padding"]
+    y = draw_header(y)
+    # Paragraph.drawOn saves/restores canvas state, so the row font only
+    # needs setting after each table header.
+    c.setFont(font, font_size)
+
+    for item, (qty_s, unit_s, total_s) in zip(invoice.line_items, cells):
+        text = item.description
+        # Fast path: plain single-line descriptions skip Platypus wrapping.
+        if (
+            not _NEEDS_PARAGRAPH.search(text)
+            and stringWidth(text, font, font_size) <= avail_width
+        ):
+            desc = None
+            desc_h = desc_style.leading
+        else:
+            desc = Paragraph(text, desc_style)
+            _, desc_h = desc.wrap(avail_width, PAGE_HEIGHT)
+
+        row_height = max(desc_h, line_height) + row_padding
 
         if y - row_height < BOTTOM_MARGIN + 70:
             c.showPage()
@@ -206,42 +372,77 @@ def _draw_line_items(c, invoice: Invoice, y: float, theme, desc_style) -> float:
             y = _draw_parties(c, invoice, y, theme)
             y -= 24
             y = draw_header(y)
-
-        desc.drawOn(c, COL_DESC, y - desc_h + 4)
-
-        c.setFont(theme["font"], theme["base_font_size"])
-        c.drawRightString(COL_QTY, y, str(item.quantity))
-        c.drawRightString(COL_UNIT, y, _fmt_money(item.unit_price, theme))
-        c.drawRightString(COL_TOTAL, y, _fmt_money(item.line_total, theme))
+            c.setFont(font, font_size)
+
+        if desc is None:
+            # Same baseline and colour Paragraph uses for its first line;
+            # the cells after it keep the colour they had before.
+            row_fill = c._fillColorObj
+            c.setFillColor(desc_fill)
+            c.drawString(COL_DESC, y + 4 - font_size, text)
+            c.setFillColor(row_fill)
+        else:
+            desc.drawOn(c, COL_DESC, y - desc_h + 4)
+
+        draw_right(COL_QTY, y, qty_s)
+        draw_right(COL_UNIT, y, unit_s)
+        draw_right(COL_TOTAL, y, total_s)
 
         y -= row_height
 
     return y
 
 
-def _fmt_money(value: float, theme) -> str:
-    return f'{theme["currency_symbol"]}{value:,.2f}'
+def _draw_label_right(c, x: float, y: float, label: str, font: str, size: float) -> None:
+    """drawRightString for fixed labels, reusing the measured width."""
+    c.drawString(x - _label_width(label, font, size), y, label)
+
+
+@lru_cache(maxsize=64)
+def _label_width(label: str, font: str, size: float) -> float:
+    return stringWidth(label, font, size)
+
+
+def _format_money(value: float, symbol: str) -> str:
+    """Format via integer cents; cheaper than the float `,.2f` path.
+
+    Only for amounts calculate_totals has already rounded to cents;
+    rounding anything else here would round twice.
+    """
+    cents = round(value * 100)
+    sign = "-" if cents < 0 else ""
+    whole, frac = divmod(abs(cents), 100)
+    return f"{symbol}{sign}{whole:,}.{frac:02d}"
 
 
 # ---------------- Totals ----------------
 def _draw_totals(c, invoice: Invoice, y: float, theme) -> None:
     label_x = COL_UNIT
     value_x = COL_TOTAL
+    draw_right = c.drawRightString
+    line_height = theme["line_height"]
+    font_size = theme["base_font_size"]
+    sym = theme["currency_symbol"]
+
+    subtotal_s, tax_s, total_s = (
+        _format_money(value, sym)
+        for value in (invoice.subtotal, invoice.tax_amount, invoice.total)
+    )
+    tax_label = f"{invoice.tax_label} ({int(invoice.tax_rate * 100)}%)"
 
-    c.setFont(theme["font"], theme["base_font_size"])
-    c.drawRightString(label_x, y, "Subtotal")
-    c.drawRightString(value_x, y, _fmt_money(invoice.subtotal, theme))
+    c.setFont(theme["font"], font_size)
+    _draw_label_right(c, label_x, y, "Subtotal", theme["font"], font_size)
+    draw_right(value_x, y, subtotal_s)
 
-    y -= theme["line_height"]
-    tax_label = f"{invoice.tax_label} ({int(invoice.tax_rate * 100)}%)"
-    c.drawRightString(label_x, y, tax_label)
-    c.drawRightString(value_x, y, _fmt_money(invoice.tax_amount, theme))
+    y -= line_height
+    draw_right(label_x, y, tax_label)
+    draw_right(value_x, y, tax_s)
 
-    y -= theme["line_height"] + 8
-    c.setFont(theme["font_bold"], theme["base_font_size"] + 1)
+    y -= line_height + 8
+    c.setFont(theme["font_bold"], font_size + 1)
     c.setFillColor(theme["accent"])
-    c.drawRightString(label_x, y, "Total")
-    c.drawRightString(value_x, y, _fmt_money(invoice.total, theme))
+    _draw_label_right(c, label_x, y, "Total", theme["font_bold"], font_size + 1)
+    draw_right(value_x, y, total_s)
     c.setFillColor(theme["text"])
 
 
@@ -1,17 +1,77 @@
 # src/reporting/json_export.py
 import json
-from pathlib import Path
-from typing import List
+from typing import Dict, Iterator, List, Union
 
-from src.reporting.totals import InvoiceTotals
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is used instead
+    orjson = None
 
+from src.reporting.totals import InvoiceTotals, TotalsBatch
 
-def export_totals_json(totals: List[InvoiceTotals], path: str) -> None:
-    out = Path(path)
 
-    data = [t.to_dict() for t in totals]
+# Above this many invoices, the stdlib path streams into the file instead of
+# building the whole document as one string first.
+STREAMING_THRESHOLD = 1000
 
-    out.write_text(
-        json.dumps(data, indent=2),
-        encoding="utf-8",
-    )
+WRITE_BUFFER_SIZE = 1 << 20
+
+
+def export_totals_json(
+    totals: Union[List[InvoiceTotals], TotalsBatch], path: str
+) -> None:
+    data = list(_records(totals))
+
+    if orjson is not None:
+        # C encoder producing UTF-8 bytes directly; several times faster on
+        # these float-heavy records.
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+
+    if len(data) > STREAMING_THRESHOLD:
+        with open(path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+            json.dump(data, f, indent=2)
+        return
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(json.dumps(data, indent=2))
+
+
+def export_totals_jsonl(
+    totals: Union[List[InvoiceTotals], TotalsBatch], path: str
+) -> None:
+    """Write one JSON object per line; memory use is constant in len(totals)."""
+    with open(path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        for record in _records(totals):
+            f.write(json.dumps(record))
+            f.write("\n")
+
+
+def export_totals_batch_json(batch: TotalsBatch, path: str) -> None:
+    """Write the batch column-wise: one array per field, keyed by field name.
+
+    The columns are serialized as they are stored, with no per-invoice dict.
+    """
+    data = {
+        "invoice_number": batch.invoice_numbers,
+        "subtotal": batch.subtotals,
+        "tax": batch.taxes,
+        "total": batch.totals,
+    }
+
+    if orjson is not None:
+        with open(path, "wb") as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+        return
+
+    with open(path, "w", encoding="utf-8", buffering=WRITE_BUFFER_SIZE) as f:
+        json.dump(data, f, indent=2)
+
+
+def _records(
+    totals: Union[List[InvoiceTotals], TotalsBatch]
+) -> Iterator[Dict[str, float | str]]:
+    if isinstance(totals, TotalsBatch):
+        return totals.records()
+    return (t.to_dict() for t in totals)
@@ -1,10 +1,10 @@
 # src/reporting/totals.py
-from dataclasses import dataclass
-from typing import Dict
+from dataclasses import dataclass, field
+from typing import Dict, Iterable, Iterator, List, Tuple
 from src.invoice_generator import Invoice
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class InvoiceTotals:
     invoice_number: str
     subtotal: float
@@ -13,17 +13,18 @@ class InvoiceTotals:
 
     @classmethod
     def from_invoice(cls, invoice: Invoice) -> "InvoiceTotals":
-        if not hasattr(invoice, "total"):
+        # One lookup both guards and fetches the total.
+        total = getattr(invoice, "total", None)
+        if total is None:
             raise ValueError("Invoice totals have not been calculated")
 
-        return cls(
-            invoice_number=invoice.invoice_number,
-            subtotal=invoice.subtotal,
-            tax=invoice.tax_amount,
-            total=invoice.total,
-        )
+        return cls(invoice.invoice_number, invoice.subtotal, invoice.tax_amount, total)
 
 
+    def as_tuple(self) -> Tuple[str, float, float, float]:
+        """Row in CSV_HEADERS order, without building a dict."""
+        return (self.invoice_number, self.subtotal, self.tax, self.total)
+
     def to_dict(self) -> Dict[str, float | str]:
         return {
             "invoice_number": self.invoice_number,
@@ -31,3 +32,47 @@ class InvoiceTotals:
             "tax": self.tax,
             "total": self.total,
         }
+
+
+@dataclass(slots=True)
+class TotalsBatch:
+    """Totals for many invoices stored column-wise (one list per field).
+
+    Exporters walk the columns with zip() instead of touching one
+    InvoiceTotals object per row.
+    """
+
+    invoice_numbers: List[str] = field(default_factory=list)
+    subtotals: List[float] = field(default_factory=list)
+    taxes: List[float] = field(default_factory=list)
+    totals: List[float] = field(default_factory=list)
+
+    @classmethod
+    def from_totals(cls, totals: Iterable[InvoiceTotals]) -> "TotalsBatch":
+        batch = cls()
+        for t in totals:
+            batch.append(t)
+        return batch
+
+    def append(self, t: InvoiceTotals) -> None:
+        self.invoice_numbers.append(t.invoice_number)
+        self.subtotals.append(t.subtotal)
+        self.taxes.append(t.tax)
+        self.totals.append(t.total)
+
+    def __len__(self) -> int:
+        return len(self.invoice_numbers)
+
+    def rows(self) -> Iterator[Tuple[str, float, float, float]]:
+        """Rows in CSV_HEADERS order."""
+        return zip(self.invoice_numbers, self.subtotals, self.taxes, self.totals)
+
+    def records(self) -> Iterator[Dict[str, float | str]]:
+        """Rows as dicts shaped like InvoiceTotals.to_dict(), built lazily."""
+        for number, subtotal, tax, total in self.rows():
+            yield {
+                "invoice_number": number,
+                "subtotal": subtotal,
+                "tax": tax,
+                "total": total,
+            }
@@ -2,6 +2,7 @@
 from __future__ import annotations
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, Any
 from reportlab.lib.colors import HexColor
@@ -9,6 +10,12 @@ from reportlab.lib.colors import HexColor
 
 Theme = Dict[str, Any]
 
+# Override keys whose values are hex strings to convert to colours.
+_COLOR_KEYS = frozenset({"accent", "text", "muted"})
+
+# Override files tend to repeat the same few colours; parse each hex once.
+_hex_color = lru_cache(maxsize=256)(HexColor)
+
 
 THEMES: dict[str, Theme] = {
     "minimal": {
@@ -44,21 +51,31 @@ def load_theme(name: str, override_path: str | None = None) -> Theme:
     if name not in THEMES:
         raise ValueError(f"Unknown theme: {name}")
 
-    theme = dict(THEMES[name])
-
+    mtime_ns = None
     if override_path:
-        path = Path(override_path)
-        if not path.exists():
+        try:
+            mtime_ns = Path(override_path).stat().st_mtime_ns
+        except FileNotFoundError:
             raise ValueError(f"Theme override not found: {override_path}")
 
-        data = json.loads(path.read_text(encoding="utf-8"))
+    # The cached theme is shared, so hand each caller its own copy.
+    return dict(_build_theme(name, override_path, mtime_ns))
+
+
+@lru_cache(maxsize=32)
+def _build_theme(name: str, override_path: str | None, mtime_ns: int | None) -> Theme:
+    # mtime_ns is only part of the cache key: an edited override is re-read.
+    theme = dict(THEMES[name])
+
+    if override_path:
+        data = json.loads(Path(override_path).read_text(encoding="utf-8"))
 
         for key, value in data.items():
             if key not in theme:
                 raise ValueError(f"Invalid theme key: {key}")
 
-            if key in {"accent", "text", "muted"}:
-                theme[key] = HexColor(value)
+            if key in _COLOR_KEYS:
+                theme[key] = _hex_color(value)
             else:
                 theme[key] = value
 
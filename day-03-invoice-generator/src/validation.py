@@ -3,6 +3,26 @@ class ValidationError(Exception):
     pass
 
 
+# Required keys in reporting order, plus frozensets for a one-shot subset
+# check on the (common) valid path.
+_REQUIRED_FIELDS = (
+    "invoice_number",
+    "invoice_date",
+    "company",
+    "client",
+    "tax_rate",
+)
+_REQUIRED_FIELDS_WITH_ITEMS = _REQUIRED_FIELDS + ("line_items",)
+_REQUIRED_PARTY_FIELDS = ("name", "address")
+_REQUIRED_ITEM_FIELDS = ("description", "quantity", "unit_price")
+
+_REQUIRED_SET = frozenset(_REQUIRED_FIELDS)
+_REQUIRED_WITH_ITEMS_SET = frozenset(_REQUIRED_FIELDS_WITH_ITEMS)
+_REQUIRED_ITEM_SET = frozenset(_REQUIRED_ITEM_FIELDS)
+
+_NUMBER_TYPES = (int, float)
+
+
 def validate_invoice_data(data: dict, *, require_line_items: bool = True) -> None:
     if not isinstance(data, dict):
         raise ValidationError("Invoice data must be a JSON object")
@@ -18,18 +38,15 @@ def validate_invoice_data(data: dict, *, require_line_items: bool = True) -> Non
 
 
 def _validate_required_fields(data: dict, require_line_items: bool) -> None:
-    required_fields = [
-        "invoice_number",
-        "invoice_date",
-        "company",
-        "client",
-        "tax_rate",
-    ]
-
     if require_line_items:
-        required_fields.append("line_items")
+        required, required_set = _REQUIRED_FIELDS_WITH_ITEMS, _REQUIRED_WITH_ITEMS_SET
+    else:
+        required, required_set = _REQUIRED_FIELDS, _REQUIRED_SET
+
+    if required_set <= data.keys():
+        return
 
-    for field in required_fields:
+    for field in required:
         if field not in data:
             raise ValidationError(f"Missing required field: '{field}'")
 
@@ -46,9 +63,7 @@ def _validate_party(party: dict, party_name: str) -> None:
     if not isinstance(party, dict):
         raise ValidationError(f"'{party_name}' must be an object")
 
-    required_fields = ["name", "address"]
-
-    for field in required_fields:
+    for field in _REQUIRED_PARTY_FIELDS:
         if field not in party:
             raise ValidationError(
                 f"Missing required field in {party_name}: '{field}'"
@@ -70,41 +85,45 @@ def _validate_line_items(items: list) -> None:
     if not items:
         raise ValidationError("'line_items' must contain at least one item")
 
+    # Reject non-objects up front so the per-item loop can assume dicts.
+    bad_index = next(
+        (i for i, item in enumerate(items) if not isinstance(item, dict)), -1
+    )
+    if bad_index >= 0:
+        raise ValidationError(
+            f"Line item at index {bad_index} must be an object"
+        )
+
     for index, item in enumerate(items):
-        if not isinstance(item, dict):
-            raise ValidationError(
-                f"Line item at index {index} must be an object"
-            )
         _validate_line_item(item, index)
 
 
 def _validate_line_item(item: dict, index: int) -> None:
-    required_fields = ["description", "quantity", "unit_price"]
-
-    for field in required_fields:
-        if field not in item:
-            raise ValidationError(
-                f"Missing field '{field}' in line item at index {index}"
-            )
+    if not _REQUIRED_ITEM_SET <= item.keys():
+        for field in _REQUIRED_ITEM_FIELDS:
+            if field not in item:
+                raise ValidationError(
+                    f"Missing field '{field}' in line item at index {index}"
+                )
 
     if not isinstance(item["description"], str) or not item["description"].strip():
         raise ValidationError(
             f"'description' in line item {index} must be a non-empty string"
         )
 
-    if not isinstance(item["quantity"], (int, float)) or item["quantity"] <= 0:
+    if not isinstance(item["quantity"], _NUMBER_TYPES) or item["quantity"] <= 0:
         raise ValidationError(
             f"'quantity' in line item {index} must be a number greater than 0"
         )
 
-    if not isinstance(item["unit_price"], (int, float)) or item["unit_price"] < 0:
+    if not isinstance(item["unit_price"], _NUMBER_TYPES) or item["unit_price"] < 0:
         raise ValidationError(
             f"'unit_price' in line item {index} must be a non-negative number"
         )
 
 
 def _validate_tax_rate(tax_rate) -> None:
-    if not isinstance(tax_rate, (int, float)):
+    if not isinstance(tax_rate, _NUMBER_TYPES):
         raise ValidationError("'tax_rate' must be a number")
 
     if tax_rate < 0 or tax_rate > 1:
@@ -31,4 +31,43 @@ def test_tax_calculation():
 def test_total_calculation():
     invoice = base_invoice()
     invoice.calculate_totals()
-    assert invoice.total == 575.0
\ No newline at end of file
+    assert invoice.total == 575.0
+
+
+def test_subtotal_matches_sum_of_rounded_line_totals():
+    invoice = base_invoice()
+    invoice.line_items = [
+        LineItem(description="Item", quantity=3, unit_price=0.335),
+        LineItem(description="Item", quantity=1, unit_price=0.1),
+        LineItem(description="Item", quantity=1, unit_price=0.2),
+    ]
+    invoice.calculate_totals()
+    assert [i.line_total for i in invoice.line_items] == [1.01, 0.1, 0.2]
+    assert invoice.subtotal == 1.31
+
+
+def test_unpadded_invoice_date_is_accepted():
+    for invoice_date, due_date in [
+        ("2024-1-5", "2024-01-19"),
+        ("2024-01-5", "2024-01-19"),
+    ]:
+        invoice = base_invoice()
+        invoice.invoice_date = invoice_date
+        invoice.calculate_totals()
+        invoice.validate()
+        assert invoice.due_date == due_date
+
+
+def test_cent_rounding_matches_round_to_two_places():
+    invoice = base_invoice()
+    invoice.line_items = [LineItem(description="Item", quantity=1, unit_price=402.285)]
+    invoice.calculate_totals()
+    assert invoice.line_items[0].line_total == 402.29
+    assert invoice.subtotal == 402.29
+
+    invoice = base_invoice()
+    invoice.line_items = [LineItem(description="Item", quantity=1, unit_price=4601.64)]
+    invoice.tax_rate = 0.125
+    invoice.calculate_totals()
+    assert invoice.tax_amount == 575.21
+    assert invoice.total == 5176.85
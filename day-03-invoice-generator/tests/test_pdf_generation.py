@@ -1,7 +1,17 @@
+import shutil
 import tempfile
 from pathlib import Path
+
+from pdfminer.high_level import extract_pages, extract_text
+from pdfminer.layout import LTChar, LTTextContainer
+
 from src.invoice_generator import Invoice, Party, LineItem
-from src.pdf_utils import generate_invoice_pdf
+from src.pdf_utils import (
+    _find_logo,
+    generate_invoice_pdf,
+    generate_invoice_pdfs,
+    generate_invoice_pdfs_parallel,
+)
 
 def sample_invoice() -> Invoice:
     company = Party(name="Mcdonalds Ltd", address="123 Queen Street", email="billing@mcdonalds.co.nz")
@@ -25,3 +35,77 @@ def test_pdf_is_generated():
         generate_invoice_pdf(invoice, str(path))
         assert path.exists()
         assert path.stat().st_size > 0
+
+
+def test_batch_pdf_has_one_page_per_invoice():
+    invoices = [sample_invoice(), sample_invoice()]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "batch.pdf"
+        generate_invoice_pdfs(invoices, str(path))
+        assert len(list(extract_pages(str(path)))) == 2
+
+
+def test_parallel_pdfs_are_generated():
+    invoices = [sample_invoice(), sample_invoice()]
+    with tempfile.TemporaryDirectory() as tmp:
+        paths = [str(Path(tmp) / f"invoice-{i}.pdf") for i in range(2)]
+        generate_invoice_pdfs_parallel(invoices, paths, max_workers=2)
+        for path in paths:
+            assert Path(path).stat().st_size > 0
+
+
+def _line_colours(path: Path) -> dict:
+    """Map each text line in the PDF to the fill colour of its first glyph."""
+    colours = {}
+    for page in extract_pages(str(path)):
+        for box in page:
+            if not isinstance(box, LTTextContainer):
+                continue
+            for line in box:
+                chars = [ch for ch in line if isinstance(ch, LTChar)]
+                if chars:
+                    colours[line.get_text().strip()] = chars[0].graphicstate.ncolor
+    return colours
+
+
+def test_descriptions_are_drawn_in_text_colour():
+    invoice = sample_invoice()
+    invoice.line_items = [
+        LineItem(description="Plain row", quantity=1, unit_price=1.0),
+        LineItem(description="Marked <b>up</b> row", quantity=1, unit_price=1.0),
+    ]
+    invoice.calculate_totals()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "invoice.pdf"
+        generate_invoice_pdf(invoice, str(path))
+        colours = _line_colours(path)
+
+    assert colours["Plain row"] == colours["Marked up row"] == (0, 0, 0)
+
+
+def test_unit_price_is_not_rounded_twice():
+    invoice = sample_invoice()
+    invoice.line_items = [LineItem(description="Item", quantity=2, unit_price=1.115)]
+    invoice.calculate_totals()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "invoice.pdf"
+        generate_invoice_pdf(invoice, str(path))
+        words = extract_text(str(path)).split()
+
+    # Unit price $1.11 (not $1.12), line amount $2.23
+    assert "$1.11" in words
+    assert "$1.12" not in words
+    assert "$2.23" in words
+
+
+def test_logo_lookup_follows_cwd_and_new_files(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    assert _find_logo("logo.png") is None
+
+    shutil.copy(Path(__file__).parents[1] / "data" / "logo.png", tmp_path / "logo.png")
+    assert _find_logo("logo.png") is not None
+
+    monkeypatch.chdir(tmp_path.parent)
+    assert _find_logo("logo.png") is None
@@ -1,6 +1,11 @@
 from pathlib import Path
 import json
 
+try:
+    from orjson import loads as _json_loads
+except ImportError:  # optional; fall back to the stdlib parser
+    _json_loads = json.loads
+
 from pdfminer.high_level import extract_text
 
 from src.normalizer import normalize_invoice_json
@@ -19,6 +24,11 @@ OUTPUT.mkdir(exist_ok=True)
 # -------------------------
 # Helpers
 # -------------------------
+def read_json(path: Path):
+    """Parse a JSON fixture straight from bytes (no str decode first)."""
+    return _json_loads(path.read_bytes())
+
+
 def normalize_text(text: str) -> str:
     """Strip trailing whitespace and empty lines for stable snapshot comparison."""
     lines = [line.rstrip() for line in text.splitlines()]
@@ -33,7 +43,7 @@ def test_invoice_pdf_snapshot():
     output_pdf = OUTPUT / "sample_invoice.pdf"
     snapshot_file = SNAPSHOTS / "sample_invoice.txt"
 
-    raw = json.loads(input_json.read_text(encoding="utf-8"))
+    raw = read_json(input_json)
     validate_invoice_data(raw)
 
     invoice = normalize_invoice_json(raw)
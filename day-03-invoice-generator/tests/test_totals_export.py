@@ -0,0 +1,91 @@
+import csv
+import json
+import tempfile
+from pathlib import Path
+
+from src.reporting.totals import InvoiceTotals, TotalsBatch
+from src.reporting.csv_export import export_totals_csv, CSV_HEADERS
+from src.reporting.json_export import (
+    export_totals_batch_json,
+    export_totals_json,
+    export_totals_jsonl,
+)
+
+
+def sample_totals():
+    return [
+        InvoiceTotals(invoice_number="INV-001", subtotal=500.0, tax=75.0, total=575.0),
+        InvoiceTotals(invoice_number="INV-002", subtotal=100.5, tax=15.08, total=115.58),
+    ]
+
+
+def test_csv_export_writes_header_and_rows():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "totals.csv"
+        export_totals_csv(sample_totals(), str(path))
+
+        with path.open(newline="", encoding="utf-8") as f:
+            rows = list(csv.reader(f))
+
+    assert rows[0] == CSV_HEADERS
+    assert rows[1:] == [
+        ["INV-001", "500.0", "75.0", "575.0"],
+        ["INV-002", "100.5", "15.08", "115.58"],
+    ]
+
+
+def test_jsonl_export_writes_one_object_per_line():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "totals.jsonl"
+        export_totals_jsonl(sample_totals(), str(path))
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+
+    assert [json.loads(line) for line in lines] == [
+        t.to_dict() for t in sample_totals()
+    ]
+
+
+def test_json_export_round_trips():
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "totals.json"
+        export_totals_json(sample_totals(), str(path))
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+
+    assert data == [t.to_dict() for t in sample_totals()]
+
+
+def test_totals_batch_exports_match_list_exports():
+    totals = sample_totals()
+    batch = TotalsBatch.from_totals(totals)
+    assert len(batch) == 2
+
+    with tempfile.TemporaryDirectory() as tmp:
+        for export, name in (
+            (export_totals_csv, "totals.csv"),
+            (export_totals_json, "totals.json"),
+            (export_totals_jsonl, "totals.jsonl"),
+        ):
+            from_list = Path(tmp) / f"list-{name}"
+            from_batch = Path(tmp) / f"batch-{name}"
+            export(totals, str(from_list))
+            export(batch, str(from_batch))
+            assert from_batch.read_bytes() == from_list.read_bytes()
+
+
+def test_batch_json_export_writes_columns():
+    batch = TotalsBatch.from_totals(sample_totals())
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "totals.json"
+        export_totals_batch_json(batch, str(path))
+
+        data = json.loads(path.read_text(encoding="utf-8"))
+
+    assert data == {
+        "invoice_number": ["INV-001", "INV-002"],
+        "subtotal": [500.0, 100.5],
+        "tax": [75.0, 15.08],
+        "total": [575.0, 115.58],
+    }
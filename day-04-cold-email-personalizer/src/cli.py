@@ -6,7 +6,7 @@ from pathlib import Path
 
 from src.loader import load_prospects
 from src.validation import validate_prospects
-from src.template_engine import parse_template
+from src.template_engine import parse_template, substitute_placeholders
 from src.renderer import render_outputs
 from src.errors import DataLoadError, ValidationError, TemplateError
 
@@ -50,30 +50,30 @@ def main() -> None:
             print("All prospects were skipped.", file=sys.stderr)
             sys.exit(2)
 
-        output_dir = args.output_dir or "outputs"
-
-        metrics = render_outputs(
-            parsed_templates=[parsed_template] * len(valid_prospects),
-            prospects=valid_prospects,
-            output_dir=output_dir,
-            export_format=args.format,
-            combined_output_path=args.combined_output,
-            dry_run=args.dry_run,
-        )
-
         # -----------------------------
         # Dry run reporting
         # -----------------------------
-        
+        # Validation has already checked every placeholder, so a dry run
+        # reports without rendering or writing anything.
         if args.dry_run:
             print("Dry run complete")
             print(
                 f"Valid prospects: {len(valid_prospects)} | "
-                f"Rendered: {metrics['rendered']} | "
-                f"Skipped: {metrics['skipped']}"
+                f"Rendered: {len(valid_prospects)} | "
+                f"Skipped: {validation_result.skipped_count}"
             )
             sys.exit(0)
 
+        output_dir = args.output_dir or "outputs"
+
+        metrics = render_outputs(
+            parsed_template=parsed_template,
+            prospects=valid_prospects,
+            output_dir=output_dir,
+            export_format=args.format,
+            combined_output_path=args.combined_output,
+        )
+
         total_skipped = (
             validation_result.skipped_count + metrics["skipped"]
         )
@@ -118,12 +118,7 @@ def _handle_preview(
 
     prospect = prospects[index]
 
-    body = parsed_template.body
-    for placeholder in parsed_template.placeholders:
-        body = body.replace(
-            f"{{{{{placeholder}}}}}",
-            prospect.get(placeholder, ""),
-        )
+    body = substitute_placeholders(parsed_template.body, prospect)
 
     if parsed_template.headers:
         headers = "\n".join(
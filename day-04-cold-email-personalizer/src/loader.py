@@ -1,10 +1,26 @@
 import csv
+import itertools
 import json
+import sys
+from decimal import Decimal
 from pathlib import Path
-from typing import List, Dict
+from typing import Dict, Iterable, List
+
+try:
+    import ijson
+except ImportError:  # optional; large JSON files are parsed in one go
+    ijson = None
 
 from src.errors import DataLoadError
 
+# Large prospect files: refill the read buffer 1 MiB at a time, not 8 KiB.
+READ_BUFFER_SIZE = 1 << 20
+
+# JSON files at least this large are streamed item by item when ijson is
+# installed, instead of materializing the whole document first.
+JSON_STREAMING_THRESHOLD = 16 << 20
+
+
 def load_prospects(path: str) -> List[Dict[str, str]]:
     """
     Load prospect data from a CSV or JSON file.
@@ -35,19 +51,24 @@ def load_prospects(path: str) -> List[Dict[str, str]]:
 
     return prospects
 
-def _detect_duplicates(prospects: list[dict[str, str]]) -> list[str]:
-    seen: set[str] = set()
-    duplicates: list[str] = []
+def _detect_duplicates(
+    prospects: list[dict[str, str]],
+) -> list[str | tuple[str, str]]:
+    # Keys are the bare email (str) or a (first_name, company) tuple; the
+    # two types never compare equal, so no "email::" prefix is needed.
+    seen: set[str | tuple[str, str]] = set()
+    duplicates: list[str | tuple[str, str]] = []
 
     for prospect in prospects:
         email = prospect.get("email", "").strip().lower()
 
         if email:
-            key = f"email::{email}"
+            key = email
         else:
-            first_name = prospect.get("first_name", "").strip().lower()
-            company = prospect.get("company", "").strip().lower()
-            key = f"{first_name}::{company}"
+            key = (
+                prospect.get("first_name", "").strip().lower(),
+                prospect.get("company", "").strip().lower(),
+            )
 
         if key in seen:
             duplicates.append(key)
@@ -60,40 +81,87 @@ def _detect_duplicates(prospects: list[dict[str, str]]) -> list[str]:
 def _load_csv(path: Path) -> List[Dict[str, str]]:
     prospects: List[Dict[str, str]] = []
 
-    with path.open(newline="", encoding="utf-8") as file:
-        reader = csv.DictReader(file)
+    with path.open(
+        "r", newline="", encoding="utf-8", buffering=READ_BUFFER_SIZE
+    ) as file:
+        # Plain rows zipped against the header once stripped; DictReader
+        # would build an intermediate dict per row only to copy it.
+        reader = csv.reader(file)
+        header = next(reader, None)
 
-        if not reader.fieldnames:
+        if not header:
             raise DataLoadError("CSV file has no header row.")
 
+        # Interned once per file: every row dict shares these key objects,
+        # and lookups with interned field names compare by identity.
+        keys = [sys.intern(key.strip()) for key in header]
+        width = len(keys)
+        strip = str.strip
+
         for row in reader:
             # Skip completely empty rows
-            if not any(row.values()):
+            if not any(row):
                 continue
 
-            cleaned = {
-                key.strip(): (value.strip() if value is not None else "")
-                for key, value in row.items()
-            }
+            missing = width - len(row)
+            if missing > 0:
+                row += [""] * missing
+            elif missing < 0:
+                raise DataLoadError(
+                    f"CSV row {reader.line_num} has more values than header columns."
+                )
 
-            prospects.append(cleaned)
+            prospects.append(dict(zip(keys, map(strip, row))))
 
     return prospects
 
 
 def _load_json(path: Path) -> List[Dict[str, str]]:
-    with path.open(encoding="utf-8") as file:
-        try:
-            data = json.load(file)
-        except json.JSONDecodeError as exc:
-            raise DataLoadError("Invalid JSON file.") from exc
+    if ijson is not None and path.stat().st_size >= JSON_STREAMING_THRESHOLD:
+        return _load_json_streaming(path)
+
+    # json.loads decodes UTF-8 bytes itself, skipping the text-file layer.
+    try:
+        data = json.loads(path.read_bytes())
+    except json.JSONDecodeError as exc:
+        raise DataLoadError("Invalid JSON file.") from exc
 
     if not isinstance(data, list):
         raise DataLoadError("JSON data must be a list of objects.")
 
+    return _clean_json_items(data)
+
+
+def _load_json_streaming(path: Path) -> List[Dict[str, str]]:
+    """Parse one prospect at a time so the full JSON tree is never held."""
+    with path.open("rb") as file:
+        try:
+            # use_float would overflow on integers beyond 64 bits and on
+            # values like 1e400, which json.loads accepts.
+            events = map(_as_stdlib_number, ijson.parse(file))
+            first = next(events, None)
+
+            if first is None or first[1] != "start_array":
+                raise DataLoadError("JSON data must be a list of objects.")
+
+            items = ijson.items(itertools.chain([first], events), "item")
+            return _clean_json_items(items)
+        except ijson.JSONError as exc:
+            raise DataLoadError("Invalid JSON file.") from exc
+
+
+def _as_stdlib_number(event):
+    """ijson yields non-integral numbers as Decimal; json.loads gives float."""
+    prefix, kind, value = event
+    if kind == "number" and isinstance(value, Decimal):
+        return prefix, kind, float(value)
+    return event
+
+
+def _clean_json_items(items: Iterable[object]) -> List[Dict[str, str]]:
     prospects: List[Dict[str, str]] = []
 
-    for idx, item in enumerate(data):
+    for idx, item in enumerate(items):
         if not isinstance(item, dict):
             raise DataLoadError(
                 f"JSON item at index {idx} is not an object."
@@ -1,15 +1,34 @@
-import re
+import os
 import csv
+import string
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import List, Dict, TypedDict, Literal
+from typing import List, Dict, Tuple, TypedDict, Literal
 
 from src.types import ParsedTemplate
+from src.template_engine import substitute_placeholders
 from src.run_metadata import write_run_metadata
 
 ExportFormat = Literal["txt", "md", "html", "eml", "csv"]
 
+# Byte table for _normalize_filename: keep [a-z0-9], everything else -> "_".
+_FILENAME_TABLE = bytes(
+    c if chr(c) in string.ascii_lowercase + string.digits else ord("_")
+    for c in range(256)
+)
+
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | os.O_TRUNC
+
+# Threads used to write per-prospect files.
+WRITE_WORKERS = min(32, (os.cpu_count() or 1) * 4)
+
+# The combined file can hold every rendered email; write it through a large
+# buffer section by section instead of joining one giant string.
+WRITE_BUFFER_SIZE = 1 << 20
+
 
 class RenderMetrics(TypedDict):
     rendered: int
@@ -18,12 +37,17 @@ class RenderMetrics(TypedDict):
 
 class RenderedProspect(TypedDict):
     content: str
+    data: bytes  # content encoded as UTF-8, shared by every output
     prospect: Dict[str, str]
     filename: str
 
 
+# (index, prospect, filename, rendered content, content as UTF-8)
+_RenderJob = Tuple[int, Dict[str, str], str, str, bytes]
+
+
 def render_outputs(
-    parsed_templates: List[ParsedTemplate],
+    parsed_template: ParsedTemplate,
     prospects: List[Dict[str, str]],
     output_dir: str,
     export_format: ExportFormat = "txt",
@@ -31,7 +55,7 @@ def render_outputs(
     dry_run: bool = False,
 ) -> RenderMetrics:
     """
-    Render parsed templates with prospect data and write outputs.
+    Render a parsed template with each prospect's data and write outputs.
 
     Supports:
     - Timestamped run directories
@@ -40,9 +64,6 @@ def render_outputs(
     - Partial success
     - Multiple export formats
     """
-    if len(parsed_templates) != len(prospects):
-        raise ValueError("Templates and prospects count do not match.")
-
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     run_dir = Path(output_dir) / timestamp
 
@@ -50,47 +71,62 @@ def render_outputs(
         run_dir.mkdir(parents=True, exist_ok=True)
 
     ordered = sorted(
-        zip(parsed_templates, prospects),
-        key=lambda p: (p[1].get("company", ""), p[1].get("first_name", "")),
+        prospects,
+        key=lambda p: (p.get("company", ""), p.get("first_name", "")),
+    )
+
+    # The template is shared by every prospect, so the body and header
+    # block are bound into one render callable up front.
+    render = partial(
+        _render_parsed_template,
+        parsed_template.body,
+        _header_block(parsed_template),
     )
 
     used_filenames: set[str] = set()
-    rendered_count = 0
-    skipped_count = 0
-    skipped_reasons: List[str] = []
+    next_suffix: Dict[str, int] = {}
+    failures: Dict[int, Exception] = {}
+    jobs: List[_RenderJob] = []
 
-    rendered_prospects: List[RenderedProspect] = []
+    # Bound methods hoisted out of the per-prospect loop.
+    mark_used = used_filenames.add
+    add_job = jobs.append
 
-    for index, (parsed, prospect) in enumerate(ordered, start=1):
+    # Filenames depend on every earlier prospect, so naming and rendering
+    # stay sequential; only the file writes are handed to worker threads.
+    for index, prospect in enumerate(ordered, start=1):
         try:
             base_name = _build_base_filename(prospect, index)
-            filename = _deduplicate_filename(base_name, used_filenames)
-            used_filenames.add(filename)
-
-            content = _render_parsed_template(parsed, prospect)
-
-            if not dry_run:
-                _write_file(
-                    content=content,
-                    path=run_dir / f"{filename}.{export_format}",
-                    export_format=export_format,
-                    prospect=prospect,
-                )
-
-            rendered_prospects.append(
-                {
-                    "content": content,
-                    "prospect": prospect,
-                    "filename": filename,
-                }
-            )
-            rendered_count += 1
+            filename = _deduplicate_filename(base_name, used_filenames, next_suffix)
+            mark_used(filename)
+
+            content = render(prospect)
+            # Encoded once here; the per-prospect file and the combined
+            # output both write these bytes.
+            add_job((index, prospect, filename, content, content.encode("utf-8")))
 
         except Exception as exc:
-            skipped_count += 1
-            skipped_reasons.append(
-                f"{_describe_prospect(prospect, index)} skipped: {exc}"
-            )
+            failures[index] = exc
+
+    if not dry_run:
+        failures.update(_write_files(jobs, run_dir, export_format))
+
+    rendered_prospects: List[RenderedProspect] = [
+        {
+            "content": content,
+            "data": data,
+            "prospect": prospect,
+            "filename": filename,
+        }
+        for index, prospect, filename, content, data in jobs
+        if index not in failures
+    ]
+    rendered_count = len(rendered_prospects)
+    skipped_count = len(failures)
+    skipped_reasons = [
+        f"{_describe_prospect(ordered[index - 1], index)} skipped: {exc}"
+        for index, exc in sorted(failures.items())
+    ]
 
     if combined_output_path and not dry_run:
         combined_path = Path(combined_output_path)
@@ -102,7 +138,7 @@ def render_outputs(
         write_run_metadata(
             run_dir=run_dir,
             timestamp=timestamp,
-            template_hash=_hash_template_contents(parsed_templates),
+            template_hash=_hash_template_contents(parsed_template),
             input_file="unknown",
             rendered_count=rendered_count,
             skipped_count=skipped_count,
@@ -119,46 +155,100 @@ def render_outputs(
 # Helpers
 # ------------------------------
 
-def _render_parsed_template(parsed: ParsedTemplate, context: Dict[str, str]) -> str:
-    body = parsed.body
-    for placeholder in parsed.placeholders:
-        body = body.replace(f"{{{{{placeholder}}}}}", context.get(placeholder, ""))
+def _header_block(parsed: ParsedTemplate) -> str:
+    if not parsed.headers:
+        return ""
+    headers = "\n".join(f"{k}: {v}" for k, v in parsed.headers.items())
+    return f"{headers}\n\n"
+
 
-    if parsed.headers:
-        headers = "\n".join(f"{k}: {v}" for k, v in parsed.headers.items())
-        return f"{headers}\n\n{body}"
+def _render_parsed_template(
+    body: str,
+    header_block: str,
+    context: Dict[str, str],
+) -> str:
+    return header_block + substitute_placeholders(body, context)
 
-    return body
+
+def _write_files(
+    jobs: List[_RenderJob],
+    run_dir: Path,
+    export_format: ExportFormat,
+) -> Dict[int, Exception]:
+    """Write one file per job on a thread pool; return failures by index."""
+    if not jobs:
+        return {}
+
+    # os.write releases the GIL, so opening and writing many small files
+    # overlaps well across threads.
+    workers = min(WRITE_WORKERS, len(jobs))
+
+    # Plain string paths: no Path object is built and normalized per file.
+    prefix = os.fspath(run_dir) + os.sep
+    suffix = "." + export_format
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            index: pool.submit(
+                _write_file,
+                content=content,
+                data=data,
+                path=prefix + filename + suffix,
+                export_format=export_format,
+                prospect=prospect,
+            )
+            for index, prospect, filename, content, data in jobs
+        }
+
+    return {
+        index: exc
+        for index, future in futures.items()
+        if (exc := future.exception()) is not None
+    }
 
 
 def _write_file(
     *,
     content: str,
-    path: Path,
+    data: bytes,
+    path: str,
     export_format: ExportFormat,
     prospect: Dict[str, str],
 ) -> None:
     if export_format == "csv":
-        with path.open("w", newline="", encoding="utf-8") as f:
+        with open(path, "w", newline="", encoding="utf-8") as f:
             writer = csv.writer(f)
             writer.writerow(["content"])
             writer.writerow([content])
         return
 
-    path.write_text(content, encoding="utf-8")
+    _write_bytes(path, data)
+
+
+def _write_bytes(path: str, data: bytes) -> None:
+    # One file per prospect: raw os.open/os.write skips building a text and
+    # buffered file object around every write. 0o666 is what open() passes,
+    # so the umask decides the final mode as before.
+    fd = os.open(path, _WRITE_FLAGS, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
 
 
 def _write_combined_output(
     rendered_prospects: List[RenderedProspect],
     path: Path,
 ) -> None:
-    sections: List[str] = []
-
-    for index, rp in enumerate(rendered_prospects, start=1):
-        header = _describe_prospect(rp["prospect"], index)
-        sections.append(f"----- {header} -----\n{rp['content']}")
-
-    path.write_text("\n\n".join(sections), encoding="utf-8")
+    with path.open("wb", buffering=WRITE_BUFFER_SIZE) as f:
+        for index, rp in enumerate(rendered_prospects, start=1):
+            if index > 1:
+                f.write(b"\n\n")
+            header = _describe_prospect(rp["prospect"], index)
+            f.write(f"----- {header} -----\n".encode("utf-8"))
+            f.write(rp["data"])
 
 
 def _build_base_filename(prospect: Dict[str, str], index: int) -> str:
@@ -173,20 +263,28 @@ def _build_base_filename(prospect: Dict[str, str], index: int) -> str:
 
 
 def _normalize_filename(value: str) -> str:
-    value = value.lower()
-    value = re.sub(r"[^a-z0-9]+", "_", value)
-    value = re.sub(r"_+", "_", value)
-    return value.strip("_")
+    # Non-ASCII characters become "?" and, like every other byte outside
+    # [a-z0-9], map to "_"; splitting on "_" then collapses runs and trims.
+    raw = value.lower().encode("ascii", "replace").translate(_FILENAME_TABLE)
+    return b"_".join(filter(None, raw.split(b"_"))).decode("ascii")
 
 
-def _deduplicate_filename(base: str, used: set[str]) -> str:
+def _deduplicate_filename(
+    base: str,
+    used: set[str],
+    next_counter: Dict[str, int],
+) -> str:
     if base not in used:
         return base
 
-    counter = 2
+    # Resume from the last suffix handed out for this base instead of
+    # probing from 2 every time. The probe still skips names that are
+    # taken by another prospect's base (e.g. a literal "sam_manning_2").
+    counter = next_counter.get(base, 2)
     while f"{base}_{counter}" in used:
         counter += 1
 
+    next_counter[base] = counter + 1
     return f"{base}_{counter}"
 
 
@@ -196,6 +294,5 @@ def _describe_prospect(prospect: Dict[str, str], index: int) -> str:
     return f"prospect #{index}"
 
 
-def _hash_template_contents(parsed_templates: List[ParsedTemplate]) -> str:
-    combined = "".join(t.body for t in parsed_templates)
-    return hashlib.sha256(combined.encode("utf-8")).hexdigest()
+def _hash_template_contents(parsed_template: ParsedTemplate) -> str:
+    return hashlib.sha256(parsed_template.body.encode("utf-8")).hexdigest()
@@ -2,6 +2,11 @@ import json
 from pathlib import Path
 from typing import List
 
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is used instead
+    orjson = None
+
 
 def write_run_metadata(
     *,
@@ -31,7 +36,16 @@ def write_run_metadata(
     }
 
     path = run_dir / "run.json"
+
+    if orjson is not None:
+        # Same layout as the stdlib branch below, encoded in C straight to
+        # UTF-8 bytes; skipped_reasons can hold one entry per prospect.
+        path.write_bytes(
+            orjson.dumps(payload, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS)
+        )
+        return
+
     path.write_text(
-        json.dumps(payload, indent=2, sort_keys=True),
+        json.dumps(payload, indent=2, sort_keys=True, ensure_ascii=False),
         encoding="utf-8",
     )
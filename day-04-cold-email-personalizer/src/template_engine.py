@@ -1,6 +1,7 @@
 import re
 import difflib
-from typing import Set, Dict
+from functools import lru_cache
+from typing import Dict, FrozenSet, Set
 
 from src.errors import TemplateError
 from src.types import ParsedTemplate
@@ -12,16 +13,66 @@ _PLACEHOLDER_PATTERN = re.compile(r"\{\{([a-z0-9_]+)\}\}")
 _FRONTMATTER_PATTERN = re.compile(r"^([A-Za-z-]+):\s*(.+)$")
 
 
-def extract_placeholders(text: str) -> Set[str]:
+@lru_cache(maxsize=128)
+def extract_placeholders(text: str) -> FrozenSet[str]:
     """
     Return all unique placeholder names found in text.
+
+    Results are cached by text, hence the immutable frozenset.
+    """
+    # A substring test is a plain C scan; static text never reaches the regex.
+    if "{{" not in text:
+        return frozenset()
+
+    return frozenset(_PLACEHOLDER_PATTERN.findall(text))
+
+
+class _BlankMissing(dict):
+    """Context mapping that renders unknown placeholders as empty strings."""
+
+    def __missing__(self, key: str) -> str:
+        return ""
+
+
+def substitute_placeholders(body: str, context: Dict[str, str]) -> str:
+    """
+    Replace every placeholder in body with its context value in one pass.
+
+    Placeholders missing from context render as empty strings.
     """
-    if not text:
-        return set()
+    format_string = _format_string(body)
+    if format_string is None:
+        return _PLACEHOLDER_PATTERN.sub(
+            lambda match: context.get(match.group(1), ""),
+            body,
+        )
 
-    return set(_PLACEHOLDER_PATTERN.findall(text))
+    return format_string.format_map(_BlankMissing(context))
 
 
+@lru_cache(maxsize=32)
+def _format_string(body: str) -> str | None:
+    """
+    Convert {{name}} placeholders to str.format fields, escaping literal braces.
+
+    format_map looks fields up in C, which is about twice as fast per render
+    as a regex callback. All-digit names would be read as positional fields,
+    so those bodies return None and keep the regex path.
+    """
+    parts = _PLACEHOLDER_PATTERN.split(body)
+    names = parts[1::2]
+
+    if any(name.isdigit() for name in names):
+        return None
+
+    parts[0::2] = [
+        text.replace("{", "{{").replace("}", "}}") for text in parts[0::2]
+    ]
+    parts[1::2] = [f"{{{name}}}" for name in names]
+    return "".join(parts)
+
+
+@lru_cache(maxsize=32)
 def parse_template(template: str) -> ParsedTemplate:
     """
     Parse a template into headers, body, and placeholders.
@@ -29,32 +80,28 @@ def parse_template(template: str) -> ParsedTemplate:
     Frontmatter is optional and consists of `Key: Value` lines
     at the top of the file, terminated by the first blank line
     or first non-header line.
+
+    Results are cached by template text, so callers must treat the
+    returned headers and placeholders as read-only.
     """
     lines = template.splitlines()
     headers: Dict[str, str] = {}
-    body_lines: list[str] = []
-
-    in_frontmatter = True
+    body_start = 0
 
+    # Only the frontmatter is walked line by line; the body is joined from
+    # the remaining lines in one go.
     for line in lines:
-        if in_frontmatter:
-            if not line.strip():
-                in_frontmatter = False
-                continue
-
-            match = _FRONTMATTER_PATTERN.match(line)
-            if match:
-                key, value = match.group(1), match.group(2).strip()
-                headers[key] = value
-                continue
+        match = _FRONTMATTER_PATTERN.match(line)
+        if not match:
+            # A blank or non-header line ends frontmatter. A leading blank
+            # line is dropped by the strip() below.
+            break
 
-            # Non-header line ends frontmatter
-            in_frontmatter = False
+        headers[match.group(1)] = match.group(2).strip()
+        body_start += 1
 
-        body_lines.append(line)
-
-    body = "\n".join(body_lines).strip()
-    placeholders = extract_placeholders(body)
+    body = "\n".join(lines[body_start:]).strip()
+    placeholders = set(_PLACEHOLDER_PATTERN.findall(body))
 
     return ParsedTemplate(
         headers=headers,
@@ -76,7 +123,6 @@ def render_template(
     - Headers are re-attached above the rendered body
     """
     parsed = parse_template(template)
-    rendered_body = parsed.body
 
     for placeholder in required_placeholders:
         if not context.get(placeholder):
@@ -89,11 +135,7 @@ def render_template(
                 message += f' Did you mean "{suggestion}"?'
             raise TemplateError(message)
 
-    for placeholder in parsed.placeholders:
-        rendered_body = rendered_body.replace(
-            f"{{{{{placeholder}}}}}",
-            context.get(placeholder, ""),
-        )
+    rendered_body = substitute_placeholders(parsed.body, context)
 
     if parsed.headers:
         header_block = "\n".join(f"{k}: {v}" for k, v in parsed.headers.items())
@@ -106,6 +148,16 @@ def _suggest_field_name(
     missing_field: str,
     available_fields: Set[str],
 ) -> str | None:
+    return _suggest_cached(missing_field, frozenset(available_fields))
+
+
+@lru_cache(maxsize=256)
+def _suggest_cached(
+    missing_field: str,
+    available_fields: FrozenSet[str],
+) -> str | None:
+    # Prospects sharing a schema miss the same field over and over; the
+    # SequenceMatcher scoring is only paid once per distinct pair.
     matches = difflib.get_close_matches(
         missing_field,
         available_fields,
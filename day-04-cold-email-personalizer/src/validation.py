@@ -1,11 +1,16 @@
 # src/validation.py
 
-from typing import List, Dict, Set
+import sys
+from typing import Dict, FrozenSet, Iterable, List, Set, Tuple
 import difflib
+from functools import lru_cache
 
 from src.errors import ValidationError
 from src.types import ValidationResult, SkippedProspect
 
+# do_not_contact values that mean "skip this prospect".
+_DNC_TRUTHY = frozenset({"1", "true", "yes", "y"})
+
 
 def validate_prospects(
     prospects: List[Dict[str, str]],
@@ -26,35 +31,41 @@ def validate_prospects(
     valid: List[Dict[str, str]] = []
     skipped: List[SkippedProspect] = []
 
-    for index, prospect in enumerate(prospects, start=1):
-        # Compliance: do not contact
-        if _is_do_not_contact(prospect):
-            skipped.append(
-                SkippedProspect(
-                    index=index,
-                    prospect=prospect,
-                    reason="do_not_contact flag is set",
-                )
-            )
+    # Blank values count as missing, so every row still needs its values
+    # checked; a shared CSV key set alone cannot vouch for a row. Sorting
+    # once also makes the reported field deterministic across runs.
+    # Interned so lookups against interned CSV header keys hit the
+    # identity fast path in dict probing.
+    fields = tuple(sys.intern(field) for field in sorted(required_fields))
+
+    # Compliance: do not contact, resolved for every row in one pass.
+    do_not_contact = _do_not_contact_mask(prospects)
+
+    # Static templates with no flagged rows: nothing left to check per row.
+    if not fields and not any(do_not_contact):
+        return ValidationResult(
+            valid_prospects=list(prospects),
+            skipped_prospects=[],
+        )
+
+    add_valid = valid.append
+    add_skipped = skipped.append
+    skip = SkippedProspect
+
+    for index, (prospect, dnc) in enumerate(
+        zip(prospects, do_not_contact), start=1
+    ):
+        if dnc:
+            add_skipped(skip(index, prospect, "do_not_contact flag is set"))
             continue
 
-        try:
-            _validate_required_fields(
-                prospect=prospect,
-                required_fields=required_fields,
-                index=index,
-            )
-        except ValidationError as exc:
-            skipped.append(
-                SkippedProspect(
-                    index=index,
-                    prospect=prospect,
-                    reason=str(exc),
-                )
-            )
+        missing = _first_missing_field(prospect, fields)
+        if missing is None:
+            add_valid(prospect)
             continue
 
-        valid.append(prospect)
+        reason = _missing_field_reason(prospect, missing, index)
+        add_skipped(skip(index, prospect, reason))
 
     return ValidationResult(
         valid_prospects=valid,
@@ -62,34 +73,58 @@ def validate_prospects(
     )
 
 
-def _validate_required_fields(
+def _first_missing_field(
     prospect: Dict[str, str],
-    required_fields: Set[str],
-    index: int,
-) -> None:
+    required_fields: Tuple[str, ...],
+) -> str | None:
+    get = prospect.get
     for field in required_fields:
-        value = prospect.get(field)
+        value = get(field)
+        if not value or not value.strip():
+            return field
+    return None
 
-        if value is None or not value.strip():
-            identifier = _describe_prospect(prospect, index)
-            suggestion = _suggest_field_name(field, set(prospect.keys()))
 
-            message = f'Missing required field "{field}" for {identifier}.'
-            if suggestion:
-                message += f' Did you mean "{suggestion}"?'
+def _missing_field_reason(
+    prospect: Dict[str, str],
+    field: str,
+    index: int,
+) -> str:
+    # Only built for rows that are actually skipped; the valid path never
+    # formats a message or raises.
+    identifier = _describe_prospect(prospect, index)
+    suggestion = _suggest_field_name(field, prospect.keys())
 
-            raise ValidationError(message)
+    message = f'Missing required field "{field}" for {identifier}.'
+    if suggestion:
+        message += f' Did you mean "{suggestion}"?'
 
+    return message
 
-def _is_do_not_contact(prospect: Dict[str, str]) -> bool:
-    value = prospect.get("do_not_contact", "")
-    return str(value).strip().lower() in {"1", "true", "yes", "y"}
+
+def _do_not_contact_mask(prospects: List[Dict[str, str]]) -> List[bool]:
+    truthy = _DNC_TRUTHY
+    return [
+        (value := prospect.get("do_not_contact")) is not None
+        and value.strip().lower() in truthy
+        for prospect in prospects
+    ]
 
 
 def _suggest_field_name(
     missing_field: str,
-    available_fields: Set[str],
+    available_fields: Iterable[str],
+) -> str | None:
+    return _suggest_cached(missing_field, frozenset(available_fields))
+
+
+@lru_cache(maxsize=256)
+def _suggest_cached(
+    missing_field: str,
+    available_fields: FrozenSet[str],
 ) -> str | None:
+    # Prospects sharing a schema miss the same field over and over; the
+    # SequenceMatcher scoring is only paid once per distinct pair.
     matches = difflib.get_close_matches(
         missing_field,
         available_fields,
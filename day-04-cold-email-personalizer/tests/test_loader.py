@@ -4,6 +4,7 @@ import json
 from pathlib import Path
 import pytest
 
+from src import loader
 from src.loader import load_prospects
 from src.errors import DataLoadError
 
@@ -22,6 +23,23 @@ def test_loads_csv_prospects(tmp_path: Path):
     assert prospects[0]["company"] == "Manning"
 
 
+def test_csv_pads_short_rows_and_skips_blank_rows(tmp_path: Path):
+    csv_file = tmp_path / "prospects.csv"
+    csv_file.write_text(
+        " first_name , company ,role\n"
+        " Sam , Manning\n"
+        ",,\n"
+        "Jordan,Manning,Engineer\n"
+    )
+
+    prospects = load_prospects(str(csv_file))
+
+    assert prospects == [
+        {"first_name": "Sam", "company": "Manning", "role": ""},
+        {"first_name": "Jordan", "company": "Manning", "role": "Engineer"},
+    ]
+
+
 def test_loads_json_prospects(tmp_path: Path):
     json_file = tmp_path / "prospects.json"
     json_file.write_text(
@@ -65,3 +83,21 @@ def test_rejects_duplicate_prospects(tmp_path: Path):
 
     with pytest.raises(DataLoadError):
         load_prospects(str(csv_file))
+
+
+def test_streamed_json_numbers_match_stdlib(tmp_path: Path, monkeypatch):
+    pytest.importorskip("ijson")
+
+    json_file = tmp_path / "prospects.json"
+    json_file.write_text(
+        '[{"first_name": "Sam", "id": 12345678901234567890,'
+        ' "score": 1e400, "rate": 2.50, "tags": [1.5, -0.0]}]'
+    )
+
+    expected = load_prospects(str(json_file))
+    monkeypatch.setattr(loader, "JSON_STREAMING_THRESHOLD", 0)
+    streamed = load_prospects(str(json_file))
+
+    assert streamed == expected
+    assert streamed[0]["id"] == "12345678901234567890"
+    assert streamed[0]["score"] == "inf"
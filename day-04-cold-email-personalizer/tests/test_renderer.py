@@ -1,5 +1,7 @@
 # tests/test_renderer.py
 
+import os
+import stat
 from pathlib import Path
 
 from src.renderer import render_outputs
@@ -16,15 +18,12 @@ def _template(body: str) -> ParsedTemplate:
     return ParsedTemplate(
         headers={},
         body=body,
-        placeholders=set(),
+        placeholders={"first_name"},
     )
 
 
 def test_renders_individual_files(tmp_path: Path):
-    parsed_templates = [
-        _template("Email for Sam"),
-        _template("Email for Jordan"),
-    ]
+    parsed_template = _template("Email for {{first_name}}")
 
     prospects = [
         {"first_name": "Sam", "company": "Manning"},
@@ -34,7 +33,7 @@ def test_renders_individual_files(tmp_path: Path):
     output_dir = tmp_path / "outputs"
 
     render_outputs(
-        parsed_templates=parsed_templates,
+        parsed_template=parsed_template,
         prospects=prospects,
         output_dir=str(output_dir),
     )
@@ -53,10 +52,7 @@ def test_renders_individual_files(tmp_path: Path):
 
 
 def test_handles_filename_collisions(tmp_path: Path):
-    parsed_templates = [
-        _template("Email one"),
-        _template("Email two"),
-    ]
+    parsed_template = _template("Email for {{first_name}}")
 
     prospects = [
         {"first_name": "Sam", "company": "Manning"},
@@ -66,7 +62,7 @@ def test_handles_filename_collisions(tmp_path: Path):
     output_dir = tmp_path / "outputs"
 
     render_outputs(
-        parsed_templates=parsed_templates,
+        parsed_template=parsed_template,
         prospects=prospects,
         output_dir=str(output_dir),
     )
@@ -85,21 +81,18 @@ def test_handles_filename_collisions(tmp_path: Path):
 
 
 def test_writes_combined_output(tmp_path: Path):
-    parsed_templates = [
-        _template("Email for Sam"),
-        _template("Email for Jordan"),
-    ]
+    parsed_template = _template("Email for {{first_name}}")
 
     prospects = [
-        {"company": "Manning"},
-        {"company": "Manning"},
+        {"first_name": "Sam", "company": "Manning"},
+        {"first_name": "Jordan", "company": "Manning"},
     ]
 
     output_dir = tmp_path / "outputs"
     combined_file = tmp_path / "combined.txt"
 
     render_outputs(
-        parsed_templates=parsed_templates,
+        parsed_template=parsed_template,
         prospects=prospects,
         output_dir=str(output_dir),
         combined_output_path=str(combined_file),
@@ -110,3 +103,21 @@ def test_writes_combined_output(tmp_path: Path):
     assert "prospect #1" in content
     assert "Email for Sam" in content
     assert "Email for Jordan" in content
+
+
+def test_output_file_mode_follows_umask(tmp_path: Path):
+    parsed_template = _template("Email for {{first_name}}")
+    output_dir = tmp_path / "outputs"
+
+    previous = os.umask(0o002)
+    try:
+        render_outputs(
+            parsed_template=parsed_template,
+            prospects=[{"first_name": "Sam", "company": "Manning"}],
+            output_dir=str(output_dir),
+        )
+    finally:
+        os.umask(previous)
+
+    output_file = _get_run_dir(output_dir) / "sam_manning.txt"
+    assert stat.S_IMODE(output_file.stat().st_mode) == 0o664
@@ -72,6 +72,25 @@ def test_renders_repeated_placeholders():
     assert rendered == "Jordan from Manning — thanks Jordan."
 
 
+def test_substituted_values_are_not_re_expanded():
+    template = "Hi {{first_name}} at {{company}}"
+
+    context = {
+        "first_name": "{{company}}",
+        "company": "Manning",
+    }
+
+    placeholders = extract_placeholders(template)
+
+    rendered = render_template(
+        template,
+        context,
+        required_placeholders=placeholders,
+    )
+
+    assert rendered == "Hi {{company}} at Manning"
+
+
 def test_missing_required_placeholder_raises():
     template = "Hi {{first_name}} from {{company}}"
 
@@ -85,3 +104,41 @@ def test_missing_required_placeholder_raises():
             context,
             required_placeholders=placeholders,
         )
+
+
+def test_renders_literal_braces_around_placeholders():
+    template = "{ {{first_name}} } {{{company}}}"
+
+    context = {
+        "first_name": "Sam",
+        "company": "Manning",
+    }
+
+    placeholders = extract_placeholders(template)
+
+    rendered = render_template(
+        template,
+        context,
+        required_placeholders=placeholders,
+    )
+
+    assert rendered == "{ Sam } {Manning}"
+
+
+def test_renders_numeric_placeholder_names():
+    template = "Step {{1}} for {{first_name}}"
+
+    context = {
+        "1": "one",
+        "first_name": "Sam",
+    }
+
+    placeholders = extract_placeholders(template)
+
+    rendered = render_template(
+        template,
+        context,
+        required_placeholders=placeholders,
+    )
+
+    assert rendered == "Step one for Sam"
@@ -68,4 +68,20 @@ def test_error_message_includes_company_when_available():
     result = validate_prospects(prospects, required_fields)
 
     assert len(result.skipped_prospects) == 1
-    assert "company=Manning" in result.skipped_prospects[0].reason
\ No newline at end of file
+    assert "company=Manning" in result.skipped_prospects[0].reason
+
+
+def test_do_not_contact_rows_are_skipped():
+    prospects = [
+        {"first_name": "Sam", "do_not_contact": " Yes "},
+        {"first_name": "Jordan", "do_not_contact": "no"},
+        {"first_name": "Alex"},
+    ]
+
+    required_fields = {"first_name"}
+
+    result = validate_prospects(prospects, required_fields)
+
+    assert [p["first_name"] for p in result.valid_prospects] == ["Jordan", "Alex"]
+    assert result.skipped_prospects[0].index == 1
+    assert result.skipped_prospects[0].reason == "do_not_contact flag is set"
@@ -1,24 +1,32 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import pandas as pd
 
 
 def check_missing_values(
     df: pd.DataFrame,
     missing_warn_threshold: float,
+    na_mask: Optional[pd.DataFrame] = None,
 ) -> Dict[str, Any]:
     """
     Measure missing value percentage per column.
 
     Fully missing columns are treated as hard failures.
     Partial missingness is surfaced for review.
+
+    `na_mask` is an optional precomputed `df.isna()`; it may
+    cover more columns than `df`.
     """
     total_rows = len(df)
     missing_percentages = {}
 
     fully_missing = []
 
+    if na_mask is None:
+        na_mask = df.isna()
+    missing_counts = na_mask.sum()
+
     for col in df.columns:
-        missing_count = df[col].isna().sum()
+        missing_count = missing_counts[col]
 
         if total_rows == 0:
             pct_missing = 0.0
@@ -56,7 +64,10 @@ def check_missing_values(
     }
 
 
-def check_empty_rows(df: pd.DataFrame) -> Dict[str, Any]:
+def check_empty_rows(
+    df: pd.DataFrame,
+    na_mask: Optional[pd.DataFrame] = None,
+) -> Dict[str, Any]:
     """
     Detect rows where all values are missing.
     """
@@ -68,7 +79,9 @@ def check_empty_rows(df: pd.DataFrame) -> Dict[str, Any]:
             "details": {},
         }
 
-    empty_row_count = df.isna().all(axis=1).sum()
+    if na_mask is None:
+        na_mask = df.isna()
+    empty_row_count = na_mask[df.columns].all(axis=1).sum()
 
     if empty_row_count > 0:
         return {
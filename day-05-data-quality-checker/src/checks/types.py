@@ -1,8 +1,11 @@
-from typing import Dict, Any
+from typing import Dict, Any, Optional
 import pandas as pd
 
 
-def check_mixed_type_columns(df: pd.DataFrame) -> Dict[str, Any]:
+def check_mixed_type_columns(
+    df: pd.DataFrame,
+    na_mask: Optional[pd.DataFrame] = None,
+) -> Dict[str, Any]:
     """
     Detect columns containing mixed numeric and non-numeric values.
     """
@@ -17,7 +20,11 @@ def check_mixed_type_columns(df: pd.DataFrame) -> Dict[str, Any]:
     mixed_columns = []
 
     for col in df.columns:
-        series = df[col].dropna()
+        series = (
+            df[col].dropna()
+            if na_mask is None
+            else df[col][~na_mask[col]]
+        )
 
         if series.empty:
             continue
@@ -50,6 +57,7 @@ def check_mixed_type_columns(df: pd.DataFrame) -> Dict[str, Any]:
 def check_numeric_like_strings(
     df: pd.DataFrame,
     numeric_ratio_threshold: float = 0.9,
+    na_mask: Optional[pd.DataFrame] = None,
 ) -> Dict[str, Any]:
     """
     Identify mostly-numeric columns that contain string values.
@@ -65,7 +73,11 @@ def check_numeric_like_strings(
     problematic = []
 
     for col in df.columns:
-        series = df[col].dropna()
+        series = (
+            df[col].dropna()
+            if na_mask is None
+            else df[col][~na_mask[col]]
+        )
 
         if series.empty:
             continue
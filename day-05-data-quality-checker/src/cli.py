@@ -1,4 +1,5 @@
 import argparse
+import pandas as pd
 from src.loader import load_csv
 from src.schema import load_schema
 from src.checks.structure import check_missing_required_columns, check_unexpected_columns
@@ -16,8 +17,8 @@ def apply_column_ignores(df, check_name, schema):
     if not ignored:
         return df
 
-    remaining = [c for c in df.columns if c not in ignored]
-    return df[remaining]
+    remaining = df.columns.difference(pd.Index(list(ignored)), sort=False)
+    return df.loc[:, remaining]
 
 
 def main() -> int:
@@ -47,6 +48,8 @@ def main() -> int:
     args = parser.parse_args()
 
     df = load_csv(args.csv_path)
+    # Shared by the completeness and type checks.
+    na_mask = df.isna()
 
     schema = load_schema(args.config) if args.config else {}
     required_columns = schema.get("required_columns", [])
@@ -64,9 +67,9 @@ def main() -> int:
         results.append(check_unexpected_columns(df, required_columns))
 
     df_mv = apply_column_ignores(df, "missing_values", schema)
-    results.append(check_missing_values(df_mv, missing_warn))
+    results.append(check_missing_values(df_mv, missing_warn, na_mask=na_mask))
 
-    results.append(check_empty_rows(df))
+    results.append(check_empty_rows(df, na_mask=na_mask))
 
     results.append(check_duplicate_rows(df, duplicate_fail))
     results.append(check_constant_columns(df, dominance_warn))
@@ -74,8 +77,8 @@ def main() -> int:
     if "numeric_ranges" in schema:
         results.append(check_numeric_ranges(df, schema["numeric_ranges"], range_fail))
 
-    results.append(check_mixed_type_columns(df))
-    results.append(check_numeric_like_strings(df))
+    results.append(check_mixed_type_columns(df, na_mask=na_mask))
+    results.append(check_numeric_like_strings(df, na_mask=na_mask))
 
     if args.list_checks:
         seen = set()
@@ -1,5 +1,30 @@
+import csv
+
+import numpy as np
 import pandas as pd
 
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pacsv
+except ImportError:  # optional; pandas' own parser is used instead
+    pa = None
+
+
+NA_VALUES = ["", " ", "NA", "N/A", "null", "None"]
+
+# pandas' default NA tokens, which keep_default_na=True also treats as
+# missing; spelled out so the arrow path does not depend on pandas internals.
+_PANDAS_DEFAULT_NA = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null",
+})
+
+_ARROW_NULL_VALUES = sorted(_PANDAS_DEFAULT_NA | set(NA_VALUES))
+
+# Arrow parses CSV in parallel blocks of this size.
+READ_BLOCK_SIZE = 4 * 1024 * 1024
+
 
 def load_csv(path: str) -> pd.DataFrame:
     """
@@ -9,13 +34,61 @@ def load_csv(path: str) -> pd.DataFrame:
     hiding mixed-type or malformed columns.
     """
     try:
-        df = pd.read_csv(
-            path,
-            dtype=str,
-            keep_default_na=True,
-            na_values=["", " ", "NA", "N/A", "null", "None"],
-        )
+        df = _read_csv_arrow(path) if pa is not None else None
+        if df is None:
+            df = pd.read_csv(
+                path,
+                dtype=str,
+                keep_default_na=True,
+                na_values=NA_VALUES,
+            )
     except Exception as exc:
         raise RuntimeError(f"Failed to load CSV: {exc}") from exc
 
     return df
+
+
+def _read_csv_arrow(path: str):
+    """
+    Read every column as a string with pyarrow's multi-threaded parser.
+
+    Returns None when the file needs pandas' handling instead
+    (no header, blank or duplicate column names, or ragged rows).
+    """
+    with open(path, newline="", encoding="utf-8-sig") as f:
+        header = next(csv.reader(f), None)
+
+    if not header or "" in header or len(set(header)) != len(header):
+        return None
+
+    # Declaring the types up front stops Arrow from inferring numbers,
+    # which would rewrite values such as "01" or "1e3".
+    convert_options = pacsv.ConvertOptions(
+        column_types={name: pa.string() for name in header},
+        null_values=_ARROW_NULL_VALUES,
+        strings_can_be_null=True,
+    )
+    read_options = pacsv.ReadOptions(
+        block_size=READ_BLOCK_SIZE,
+        use_threads=True,
+    )
+
+    try:
+        table = pacsv.read_csv(
+            path,
+            read_options=read_options,
+            convert_options=convert_options,
+        )
+    except pa.ArrowInvalid:
+        return None
+
+    df = table.to_pandas(self_destruct=True, split_blocks=True)
+
+    # Without pandas' string dtype, Arrow strings become object columns
+    # holding None where read_csv would put NaN.
+    object_columns = df.columns[df.dtypes == object]
+    if len(object_columns):
+        objects = df[object_columns]
+        df[object_columns] = objects.where(objects.notna(), np.nan)
+
+    return df
@@ -1,14 +1,42 @@
 import json
+from collections import defaultdict
 from pathlib import Path
 from typing import List, Dict, Optional
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:  # optional; the stdlib encoder is used instead
+    orjson = None
+
 
 def _load_baseline(path: str) -> Dict:
     baseline_file = Path(path)
     if not baseline_file.exists():
         raise FileNotFoundError(f"Baseline report not found: {path}")
-    return json.loads(baseline_file.read_text())
+    return json.loads(baseline_file.read_bytes())
+
+
+def _write_json(path: Path, payload: Dict) -> None:
+    if orjson is not None:
+        # Same layout as the stdlib branch below; check details carry
+        # numpy scalars, and column names need not be strings.
+        path.write_bytes(
+            orjson.dumps(
+                payload,
+                option=(
+                    orjson.OPT_INDENT_2
+                    | orjson.OPT_SERIALIZE_NUMPY
+                    | orjson.OPT_NON_STR_KEYS
+                ),
+            )
+        )
+        return
+
+    path.write_text(
+        json.dumps(payload, indent=2, ensure_ascii=False),
+        encoding="utf-8",
+    )
 
 
 def _compare_to_baseline(current: Dict, baseline: Dict) -> Dict:
@@ -47,6 +75,11 @@ def _compare_to_baseline(current: Dict, baseline: Dict) -> Dict:
 
 SEVERITY_ORDER = {"pass": 0, "warn": 1, "fail": 2}
 
+STATUS_SYMBOL = {"pass": "✔", "warn": "⚠", "fail": "✖"}
+
+# Checks whose flagged columns say something about the column dtype.
+_DTYPE_CHECKS = frozenset({"mixed_type_columns", "numeric_like_strings"})
+
 
 def apply_severity_policy(
     results: List[Dict],
@@ -108,30 +141,18 @@ def generate_report(
     row_count = len(df)
     column_count = len(df.columns)
 
-    passes = sum(1 for r in results if r["status"] == "pass")
-    warns = sum(1 for r in results if r["status"] == "warn")
-    fails = sum(1 for r in results if r["status"] == "fail")
-
-    # ---- Health score ----
-    health_score = max(
-        0,
-        100 - (warns * 5) - (fails * 20),
+    # ---- Aggregate statuses, column issues and categories ----
+    status_counts = {"pass": 0, "warn": 0, "fail": 0}
+    columns_summary: Dict[str, Dict] = {}
+    category_summary: Dict[str, Dict[str, int]] = defaultdict(
+        lambda: {"pass": 0, "warn": 0, "fail": 0}
     )
 
-    # ---- Dataset status ----
-    if fails > 0 or (strict and warns > 0):
-        dataset_status = "fail"
-        exit_code = 2
-    elif warns > 0:
-        dataset_status = "warn"
-        exit_code = 1
-    else:
-        dataset_status = "pass"
-        exit_code = 0
-
-    # ---- Aggregate column issues ----
-    columns_summary: Dict[str, Dict] = {}
     for r in results:
+        status = r["status"]
+        status_counts[status] += 1
+        category_summary[r.get("category", "unknown")][status] += 1
+
         details = r.get("details")
         if not isinstance(details, dict):
             continue
@@ -149,23 +170,33 @@ def generate_report(
             if r["name"] == "missing_values":
                 columns_summary[col]["missing_pct"] = val
 
-            if r["name"] in {"mixed_type_columns", "numeric_like_strings"}:
+            if r["name"] in _DTYPE_CHECKS:
                 columns_summary[col]["dtype"] = (
                     "mixed"
                     if r["name"] == "mixed_type_columns"
                     else "numeric"
                 )
 
-    category_summary: Dict[str, Dict[str, int]] = {}
+    passes = status_counts["pass"]
+    warns = status_counts["warn"]
+    fails = status_counts["fail"]
 
-    for r in results:
-        category = r.get("category", "unknown")
-        category_summary.setdefault(
-            category,
-            {"pass": 0, "warn": 0, "fail": 0}
-        )
-        category_summary[category][r["status"]] += 1
+    # ---- Health score ----
+    health_score = max(
+        0,
+        100 - (warns * 5) - (fails * 20),
+    )
 
+    # ---- Dataset status ----
+    if fails > 0 or (strict and warns > 0):
+        dataset_status = "fail"
+        exit_code = 2
+    elif warns > 0:
+        dataset_status = "warn"
+        exit_code = 1
+    else:
+        dataset_status = "pass"
+        exit_code = 0
 
     report = {
         "dataset": {
@@ -197,11 +228,9 @@ def generate_report(
                 exit_code = 2
 
     output_file = Path(output_path)
-    output_file.write_text(json.dumps(report, indent=4))
+    _write_json(output_file, report)
 
     # ---- Console output ----
-    status_symbol = {"pass": "✔", "warn": "⚠", "fail": "✖"}
-
     print(f"\nData Quality Check — {dataset_status.upper()}")
     print(f"Health score: {health_score}/100\n")
     print(f"Rows: {row_count}")
@@ -209,7 +238,7 @@ def generate_report(
 
     print("Checks:")
     for r in results:
-        symbol = status_symbol.get(r["status"], "?")
+        symbol = STATUS_SYMBOL.get(r["status"], "?")
         extra = ""
         if r["status"] != "pass" and isinstance(r.get("details"), dict):
             extra = f" ({len(r['details'])} columns affected)"
@@ -257,7 +286,7 @@ def generate_report(
         run_summary["regression"] = baseline_comparison["regression"]
         run_summary["health_score_delta"] = baseline_comparison["health_score_delta"]
 
-    summary_path.write_text(json.dumps(run_summary, indent=2))
+    _write_json(summary_path, run_summary)
 
     print(f"\nReport written to: {output_file}\n")
   
@@ -24,3 +24,20 @@ def test_partial_missing_warns():
 
     assert result["status"] == "warn"
     assert "a" in result["details"]
+
+
+def test_precomputed_na_mask_matches_default():
+    df = pd.DataFrame({
+        "a": [1, None, 3, None],
+        "b": [1, 2, 3, 4],
+        "c": [None, None, None, None],
+    })
+    subset = df[["a", "b"]]
+
+    result = check_missing_values(
+        subset,
+        missing_warn_threshold=0.25,
+        na_mask=df.isna(),
+    )
+
+    assert result == check_missing_values(subset, missing_warn_threshold=0.25)
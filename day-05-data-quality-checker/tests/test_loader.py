@@ -0,0 +1,42 @@
+import pandas as pd
+import pytest
+from src import loader
+
+
+def test_arrow_loader_matches_pandas_loader(tmp_path, monkeypatch):
+    pytest.importorskip("pyarrow")
+
+    path = tmp_path / "data.csv"
+    path.write_text(
+        "id,name,val\n"
+        "1,NaN,nan\n"
+        "2,NULL,n/a\n"
+        "3,#N/A,<NA>\n"
+        "4, ,-nan\n"
+        "5,None,1.#IND\n"
+        "6,01,1e3\n"
+    )
+
+    arrow_df = loader._read_csv_arrow(str(path))
+    assert arrow_df is not None
+
+    monkeypatch.setattr(loader, "pa", None)
+    pandas_df = loader.load_csv(str(path))
+
+    pd.testing.assert_frame_equal(arrow_df, pandas_df)
+
+
+def test_blank_header_uses_pandas_loader(tmp_path):
+    pytest.importorskip("pyarrow")
+
+    path = tmp_path / "data.csv"
+    path.write_text(",name\n1,a\n")
+
+    assert loader._read_csv_arrow(str(path)) is None
+    assert list(loader.load_csv(str(path)).columns) == ["Unnamed: 0", "name"]
+
+
+def test_default_na_tokens_match_pandas():
+    parsers = pytest.importorskip("pandas._libs.parsers")
+
+    assert loader._PANDAS_DEFAULT_NA == parsers.STR_NA_VALUES